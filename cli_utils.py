@@ -1,48 +1,73 @@
+import re
+
 from colorama import Fore, Style
 
+try:
+    import readline  # noqa: F401  (gives input() line editing and history where available)
+
+    # readline needs non-printing sequences in the prompt marked so it can measure its width
+    _RL_START, _RL_END = "\001", "\002"
+except ImportError:
+    _RL_START = _RL_END = ""
+
+_INT_RE = re.compile(r"^-?\d+$").match
+
+# Color prefixes built once rather than on every call
+_ERR = f"{Fore.RED}{Style.BRIGHT}❌ "
+_OK = f"{Fore.GREEN}{Style.BRIGHT}✅ "
+_INFO = f"{Fore.BLUE}ℹ️  "
+_HEADER = f"{Fore.MAGENTA}{Style.BRIGHT}"
+_PROMPT = f"{_RL_START}{Fore.CYAN}{Style.BRIGHT}{_RL_END}"
+_PROMPT_END = f"{_RL_START}{Style.RESET_ALL}{_RL_END}"
+
 
 def get_valid_int(prompt_text, min_val, max_val, min_msg=None, max_msg=None, allow_zero=True):
+    max_digits = len(str(max(abs(min_val), abs(max_val))))
     while True:
-        try:
-            user_input = prompt(prompt_text).strip()
-            if allow_zero and user_input == "0":
-                return 0
+        user_input = prompt(prompt_text).strip()
+        if allow_zero and user_input == "0":
+            return 0
 
-            value = int(user_input)
-            if value < min_val:
-                if min_msg:
-                    print_error(min_msg)
-                else:
-                    print_error(f"Please enter a number greater than or equal to {min_val}.")
-                continue
-            if value > max_val:
-                if max_msg:
-                    print_error(max_msg)
-                else:
-                    print_error(max_msg if max_msg else f"Please enter a number less than or equal to {max_val}.")
-                continue
-
-            return value
-        except ValueError:
+        if not _INT_RE(user_input):
             print_error("Invalid input. Please enter a valid number.")
+            continue
+
+        # longer than any in-range number (and possibly past int()'s digit limit), so don't parse it
+        if len(user_input.lstrip("-").lstrip("0")) > max_digits:
+            value = float("-inf") if user_input.startswith("-") else float("inf")
+        else:
+            value = int(user_input)
+        if value < min_val:
+            if min_msg:
+                print_error(min_msg)
+            else:
+                print_error(f"Please enter a number greater than or equal to {min_val}.")
+            continue
+        if value > max_val:
+            if max_msg:
+                print_error(max_msg)
+            else:
+                print_error(max_msg if max_msg else f"Please enter a number less than or equal to {max_val}.")
+            continue
+
+        return value
 
 
 def print_error(text):
-    print(f"{Fore.RED}{Style.BRIGHT}❌ {text}")
+    print(_ERR + text)
 
 
 def print_success(text):
-    print(f"{Fore.GREEN}{Style.BRIGHT}✅ {text}")
+    print(_OK + text)
 
 
 def print_info(text):
-    print(f"{Fore.BLUE}ℹ️  {text}")
+    print(_INFO + text)
 
 
 def print_header(text):
-    print(f"{Fore.MAGENTA}{Style.BRIGHT}{text}")
+    print(_HEADER + text)
 
 
 def prompt(text, end=""):
-    print(f"{Fore.CYAN}{Style.BRIGHT}{text}", end=end)
-    return input()
+    return input(_PROMPT + text + end + _PROMPT_END)
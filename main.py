@@ -1,14 +1,19 @@
+import asyncio
+import atexit
 import sys
 from datetime import datetime
+from functools import lru_cache
 from io import BytesIO
 from urllib.parse import urljoin
 
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
 from colorama import Fore, Style, init
 from fake_useragent import UserAgent
 from PIL import Image
 from pylatexenc.latex2text import LatexNodes2Text
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
 from term_image.image import AutoImage
 
 from cli_utils import (
@@ -25,6 +30,31 @@ ua = UserAgent()
 converter = LatexNodes2Text()
 init(autoreset=True)
 
+# One user agent for the whole run; ua.random is slow and rotating it buys nothing
+DEFAULT_HEADERS = {"User-Agent": ua.random}
+
+# Shared session so every request to AoPS reuses the same keep-alive connection
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20))
+SESSION.headers.update(DEFAULT_HEADERS)
+atexit.register(SESSION.close)
+
+# Parsed problem pages and their solution sections, keyed by problem URL
+_tree_cache: dict[str, LexborHTMLParser] = {}
+_sections_cache: dict[str, list[str]] = {}
+# Section headings of each parsed page (minus the TOC's "Contents" heading), keyed by problem URL
+_h2_cache: dict[str, list] = {}
+
+# Block elements whose contents make up a solution section
+_BLOCK_TAGS = frozenset(("p", "ul", "ol", "div"))
+
+
+@lru_cache(maxsize=4096)
+def _latex_to_text(latex):
+    """Convert a LaTeX fragment to text, memoized since pages repeat the same snippets."""
+    return converter.latex_to_text(latex).strip("\n")
+
+
 # Years that AMC tests started and ended
 TEST_AVAILABILITY = {
     "AJHSME": {
@@ -66,20 +96,25 @@ TEST_AVAILABILITY = {
     },
 }
 
+# Tests offered in each year, computed once instead of scanning TEST_AVAILABILITY per call
+# (the year bound is fixed at startup and shared with the year prompt in main)
+LATEST_YEAR = datetime.now().year
+_YEAR_INDEX = {
+    y: tuple(t for t, c in TEST_AVAILABILITY.items() if c["start_year"] <= y <= (c["end_year"] or 9999))
+    for y in range(1950, LATEST_YEAR + 1)
+}
+_YEAR_INDEX_SETS = {y: frozenset(tests) for y, tests in _YEAR_INDEX.items()}
 
-def get_valid_test_type(year):
-    """Get a valid test type based on the year."""
-    year_int = int(year)
 
+def get_valid_test_type(year_int: int):
+    """Get a valid test type based on the year."""
     try:
-        print_header(f"\n📋 Available test types for {year}:")
+        print_header(f"\n📋 Available test types for {year_int}:")
 
         # Get the available tests for the year
-        valid_tests = []
-        for test, config in TEST_AVAILABILITY.items():
-            if config["start_year"] <= year_int and (config["end_year"] is None or year_int <= config["end_year"]):
-                valid_tests.append(test)
-                print(f"{Fore.GREEN}  • {test} ({config['description']})")
+        valid_tests = _YEAR_INDEX_SETS[year_int]
+        for test in _YEAR_INDEX[year_int]:
+            print(f"{Fore.GREEN}  • {test} ({TEST_AVAILABILITY[test]['description']})")
 
         print()
         while True:
@@ -90,7 +125,7 @@ def get_valid_test_type(year):
 
             # Validate test type based on year
             if test_type in valid_tests:
-                print_success(f"Test type '{test_type}' is valid for the year {year}.")
+                print_success(f"Test type '{test_type}' is valid for the year {year_int}.")
                 return test_type
             else:
                 print_error("Invalid test type. Please choose from the available options.")
@@ -103,10 +138,7 @@ def construct_url(year, test_type):
     """Construct the AoPS wiki URL for the given year and test type."""
     base_url = "https://artofproblemsolving.com/wiki/index.php"
 
-    if test_type in ["AIME", "AIME_I", "AIME_II", "AJHSME", "AHSME"]:
-        return f"{base_url}/{year}_{test_type}_Answer_Key"
-    else:
-        return f"{base_url}/{year}_AMC_{test_type}_Answer_Key"
+    return f"{base_url}/{year}_{TEST_AVAILABILITY[test_type]['url_format']}_Answer_Key"
 
 
 def scrape_answers(url):
@@ -114,17 +146,17 @@ def scrape_answers(url):
     try:
         print_info(f"Fetching data from: {url}")
 
-        response = requests.get(url, headers={"User-Agent": ua.random}, timeout=10)
+        response = SESSION.get(url, timeout=10)
         response.raise_for_status()
 
         print_success("Successfully fetched webpage!")
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        tree = LexborHTMLParser(response.content)
 
-        elements = soup.select("div.mw-parser-output > ol > li")
+        elements = tree.css("div.mw-parser-output > ol > li")
         if elements:
             print_success("Found answer elements on the page.")
-            return [li.text.strip() for li in elements if li.text.strip()]
+            return [text for text in (li.text().strip() for li in elements) if text]
         else:
             print_error("No answers found with the expected format. The page structure might have changed.")
             return None
@@ -133,57 +165,87 @@ def scrape_answers(url):
         return None
 
 
+async def fetch_all(urls):
+    """Fetch several pages concurrently, returning a dict of url -> page content."""
+    semaphore = asyncio.BoundedSemaphore(8)
+
+    async def fetch(session, url):
+        async with semaphore:
+            try:
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    return url, await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                return url, None  # left out of the result so the caller refetches it
+
+    connector = aiohttp.TCPConnector(limit_per_host=8)
+    async with aiohttp.ClientSession(
+        connector=connector,
+        headers=DEFAULT_HEADERS,
+        timeout=aiohttp.ClientTimeout(total=10),
+    ) as session:
+        results = await asyncio.gather(*(fetch(session, url) for url in urls))
+
+    return {url: content for url, content in results if content is not None}
+
+
 def find_solutions(url, answers):
-    def fetch_solution_sections(soup):
-        toc_sections = soup.find_all(class_="toclevel-1")
+    def fetch_solution_sections(tree):
+        toc_sections = tree.css(".toclevel-1")
         result = []
         for content in toc_sections:
-            text_el = content.find(class_="toctext")
+            text_el = content.css_first(".toctext")
             if text_el:
-                result.append(text_el.text.strip())
+                result.append(text_el.text().strip())
         return result
 
-    def extract_solution_content(soup, section_index, base_url):
-        mw_content = soup.find("div", class_="mw-parser-output")
-        if not mw_content:
-            return []
-
-        h2_tags = mw_content.find_all("h2")
-        if h2_tags:
-            h2_tags.pop(0)
+    def extract_solution_content(tree, section_index, problem_url):
+        h2_tags = _h2_cache.get(problem_url)
+        if h2_tags is None:
+            mw_content = tree.css_first("div.mw-parser-output")
+            h2_tags = _h2_cache[problem_url] = mw_content.css("h2")[1:] if mw_content else []
         if not (0 <= section_index < len(h2_tags)):
             return []
 
         selected_h2 = h2_tags[section_index]
         solution_content = []
 
-        sibling = selected_h2.next_sibling
+        # local bindings for the hot loop over every descendant
+        _strip = str.strip
+        _append = solution_content.append
+
+        sibling = selected_h2.next
         while sibling:
-            if getattr(sibling, "name", None) == "h2":
+            name = sibling.tag
+            if name == "h2":
                 break
 
-            if getattr(sibling, "name", None) in ["p", "ul", "ol", "div"]:
-                for elem in sibling.descendants:
-                    if getattr(elem, "name", None) == "img":
+            if name in _BLOCK_TAGS:
+                for elem in sibling.traverse(include_text=True):
+                    if elem.tag == "-text":
+                        text = _strip(elem.text(deep=False))
+                        if text:
+                            _append(text)
+
+                    elif elem.tag == "img":
                         # give the url to work with later
-                        img_src = elem.get("src", "")
-                        img_alt = elem.get("alt", "")
+                        img_src = elem.attributes.get("src") or ""
+                        img_alt = elem.attributes.get("alt") or ""
                         if img_src and img_alt:
                             if "[asy]" in img_alt:  # its an image for sure
-                                img_url = urljoin(base_url, img_src)
-                                solution_content.append({"image_url": img_url})
+                                _append({"image_url": urljoin(problem_url, img_src)})
                             else:
-                                solution_content.append(converter.latex_to_text(img_alt).strip("\n"))
-
-                    elif isinstance(elem, str):
-                        text = elem.strip()
-                        if text:
-                            solution_content.append(text)
-            sibling = sibling.next_sibling
+                                _append(_latex_to_text(img_alt))
+            sibling = sibling.next
 
         return solution_content
 
     max_question = len(answers)
+    print_info(f"Prefetching solution pages for questions 1 to {max_question}...")
+    problem_base = url.replace("_Answer_Key", "_Problems")
+    problem_urls = [f"{problem_base}/Problem_{n}" for n in range(1, max_question + 1)]
+    uncached_urls = [problem_url for problem_url in problem_urls if problem_url not in _tree_cache]
+    page_cache = asyncio.run(fetch_all(uncached_urls)) if uncached_urls else {}
     print_info(f"Ready to fetch solutions for questions 1 to {max_question}.")
 
     while True:
@@ -193,13 +255,22 @@ def find_solutions(url, answers):
                 print_info("Exiting solution finder.")
                 break
 
-            print_info(f"Fetching solution page for question {question}...")
-            problem_url = f"{url.replace('_Answer_Key', '_Problems')}/Problem_{question}"
-            response = requests.get(problem_url, headers={"User-Agent": ua.random}, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "html.parser")
-            sections = fetch_solution_sections(soup)
+            problem_url = f"{problem_base}/Problem_{question}"
+            if problem_url in _tree_cache:
+                tree = _tree_cache[problem_url]
+                sections = _sections_cache[problem_url]
+            else:
+                page = page_cache.get(problem_url)
+                if page is None:
+                    print_info(f"Fetching solution page for question {question}...")
+                    response = SESSION.get(problem_url, timeout=10)
+                    response.raise_for_status()
+                    page = response.content
+
+                tree = LexborHTMLParser(page)
+                sections = fetch_solution_sections(tree)
+                _tree_cache[problem_url] = tree
+                _sections_cache[problem_url] = sections
 
             if not sections:
                 print_error("No solution sections found for this question.")
@@ -214,7 +285,7 @@ def find_solutions(url, answers):
                 continue
 
             print_info("Fetching and displaying solution...")
-            content = extract_solution_content(soup, section_choice - 1, problem_url)
+            content = extract_solution_content(tree, section_choice - 1, problem_url)
 
             if content:
                 print_success("📝 Solution:")
@@ -224,7 +295,7 @@ def find_solutions(url, answers):
                     elif isinstance(item, dict) and "image_url" in item:
                         try:
                             # fetch into memory
-                            img_data = requests.get(item["image_url"]).content
+                            img_data = SESSION.get(item["image_url"], timeout=10).content
                             img = Image.open(BytesIO(img_data))
 
                             # write white over transparent bg (chatgpt help)
@@ -258,15 +329,13 @@ def main():
     while True:
         try:
             # Get valid inputs from user
-            test_year = str(
-                get_valid_int(
-                    "📅 Enter the year of the AMC test: ",
-                    1950,
-                    datetime.now().year,
-                    min_msg="Tests started in 1950, please enter a year after.",
-                    max_msg="Do not enter a year in the future",
-                    allow_zero=False,
-                )
+            test_year = get_valid_int(
+                "📅 Enter the year of the AMC test: ",
+                1950,
+                LATEST_YEAR,
+                min_msg="Tests started in 1950, please enter a year after.",
+                max_msg="Do not enter a year in the future",
+                allow_zero=False,
             )
             test_type = get_valid_test_type(test_year)
 
@@ -278,11 +347,12 @@ def main():
                 print(f"\n{Fore.BLUE}{Style.BRIGHT}🎯 Answers for {test_year} {test_type}:")
                 print(f"{Fore.BLUE}{'-' * 50}")
 
-                # Print answers with alternating colors
-                for i, answer in enumerate(answers, 1):
-                    print(Fore.WHITE, end="")
-                    color = Style.BRIGHT if i % 2 == 1 else Style.NORMAL
-                    print(f"{color}{i:2d}. {answer}")
+                # Print answers with alternating colors in a single write
+                lines = [
+                    (Style.BRIGHT if i % 2 == 1 else Style.NORMAL) + f"{i:2d}. " + answer
+                    for i, answer in enumerate(answers, 1)
+                ]
+                sys.stdout.write("\n".join(lines) + "\n")
             else:
                 print_error("Failed to retrieve answers. Please check if the test exists on AoPS wiki.")
 